@@ -5,11 +5,15 @@ from ._core import (
     annotate_spec,
     asdict,
     asjson,
+    asjson_many,
+    asmsgpack,
     asyaml,
     check,
     field,
     fromdict,
     fromjson,
+    fromjson_many,
+    frommsgpack,
     fromyaml,
     rule,
     spec,
@@ -30,12 +34,16 @@ __all__ = (
     "Rule",
     "annotate_spec",
     "asdict",
-    "asjson", 
+    "asjson",
+    "asjson_many",
+    "asmsgpack",
     "asyaml",
     "check",
     "field",
     "fromdict",
     "fromjson",
+    "fromjson_many",
+    "frommsgpack",
     "fromyaml",
     "rule",
     "spec",
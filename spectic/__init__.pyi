@@ -113,9 +113,14 @@ def rule(expr: Callable[[Any], bool], message: Optional[str] = None) -> Rule: ..
 def rule(expr: None = None, message: Optional[str] = None) -> Callable[[Callable[[Any], bool]], Callable[[Any], bool]]: ...
 
 # --- Spec decorator ---
+@overload
 @dataclass_transform(field_specifiers=(Field, field))
 def spec(cls: Type[T]) -> Type[Struct]: ...
 
+@overload
+@dataclass_transform(field_specifiers=(Field, field))
+def spec(*, ide_hints: Optional[bool] = None) -> Callable[[Type[T]], Type[Struct]]: ...
+
 # --- Check function ---
 @overload
 def check(func: Callable[..., T]) -> Callable[..., T]: ...
@@ -129,7 +134,11 @@ def annotate_spec(cls: Type[T]) -> Type[T]: ...
 # --- Conversion functions ---
 def asdict(obj: Any) -> Dict[str, Any]: ...
 def asjson(obj: Any, *, indent: Optional[int] = None) -> bytes: ...
+def asjson_many(objs: Union[List[Any], Tuple[Any, ...]]) -> bytes: ...
+def asmsgpack(obj: Any) -> bytes: ...
 def asyaml(obj: Any, *, indent: int = 2) -> str: ...
 def fromdict(data: Dict[str, Any], cls: Type[T]) -> T: ...
 def fromjson(json_str: Union[str, bytes], cls: Type[T]) -> T: ...
+def fromjson_many(json_str: Union[str, bytes], cls: Type[T]) -> List[T]: ...
+def frommsgpack(data: bytes, cls: Type[T]) -> T: ...
 def fromyaml(yaml_str: str, cls: Type[T]) -> T: ...
\ No newline at end of file
@@ -1,7 +1,11 @@
 import inspect
 import functools
+import linecache
+import operator
+import os
+import sys
 from types import EllipsisType
-from typing import Annotated, Any, Callable, ClassVar, TypeVar, get_type_hints, get_origin, get_args, cast
+from typing import Annotated, Any, Callable, ClassVar, TypedDict, TypeVar, get_type_hints, get_origin, get_args, cast
 
 # Import dataclass_transform for IDE support
 try:
@@ -22,23 +26,132 @@ import msgspec
 __version__ = "0.1.0"
 
 
+from ._hooks import _msgspec_json_encoder as _json_encoder
 from ._hooks import default_deserializer, default_serializer
-from .utils import unwrap_annotation
+from .utils import UnionTypes, unwrap_annotation
+
+
+# dec_hook pre-bound once so hot call sites don't rebuild the kwargs dict
+_convert = functools.partial(msgspec.convert, dec_hook=default_deserializer)
+
+# encoders are stateful C objects - build them once and reuse across calls;
+# the JSON one is shared with _hooks so the process carries a single instance
+_msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=default_serializer)
+
+
+# typed decoders compile per-schema state internally; cache one per target
+# class so repeated decodes skip the setup cost
+@functools.lru_cache(maxsize=None)
+def _json_decoder(cls: type) -> "msgspec.json.Decoder":
+  return msgspec.json.Decoder(cls, dec_hook=default_deserializer)
+
+
+@functools.lru_cache(maxsize=None)
+def _msgpack_decoder(cls: type) -> "msgspec.msgpack.Decoder":
+  return msgspec.msgpack.Decoder(cls, dec_hook=default_deserializer)
+
+
+# newer msgspec can indent during encoding (one pass); older versions need
+# a separate format() pass - detect once at import
+try:
+  msgspec.json.Encoder(indent=0)
+  _ENCODER_SUPPORTS_INDENT = True
+except TypeError:
+  _ENCODER_SUPPORTS_INDENT = False
+
+
+@functools.lru_cache(maxsize=None)
+def _indent_encoder(indent: int) -> "msgspec.json.Encoder":
+  return msgspec.json.Encoder(enc_hook=default_serializer, indent=indent)
+
+
+# identical constraint sets share one Meta instance, shrinking the type-info
+# graph and letting msgspec's identity-based caches hit more often
+@functools.lru_cache(maxsize=None)
+def _intern_meta(items: tuple) -> msgspec.Meta:
+  return msgspec.Meta(**dict(items))
+
+
+# IDE/type-checker shims are on by default; set SPECTIC_IDE_HINTS=0 to skip
+# them process-wide and keep generated classes lean
+_IDE_HINTS_DEFAULT = os.environ.get("SPECTIC_IDE_HINTS", "1").lower() not in ("0", "false")
 
 
 # utility functions for type handling
+@functools.lru_cache(maxsize=None)
+def _class_hints(cls: type) -> dict[str, Any]:
+  """Resolve (and memoize) annotated type hints for a class.
+
+  ``get_type_hints`` walks the MRO and re-evaluates every annotation each
+  time it runs; caching per class makes re-decoration and dynamic spec
+  generation essentially free. When no annotation is a forward-ref
+  string, the already-evaluated ``__annotations__`` dicts are merged
+  directly and the typing machinery is skipped altogether.
+  """
+  from typing import ForwardRef
+
+  hints: dict[str, Any] = {}
+  for base in reversed(cls.__mro__):
+    hints.update(vars(base).get("__annotations__", None) or {})
+  if any(isinstance(v, (str, ForwardRef)) for v in hints.values()):
+    return get_type_hints(cls, include_extras=True)
+  return hints
+
+
+@functools.lru_cache(maxsize=4096)
+def _unwrap_base_type(annotation: Any) -> Any:
+    # use unwrap_annotation from utils to properly handle any type of annotation
+    base_type, _, _ = unwrap_annotation(annotation)
+    return base_type
+
+
 def get_base_type(annotation: Any) -> Any:
     """Get the base type from any annotation, handling Annotated types properly."""
-    if get_origin(annotation) is Annotated:
-        # use unwrap_annotation from utils to properly handle any type of annotation
+    if get_origin(annotation) is not Annotated:
+        # plain types dominate - return before touching the unwrap machinery
+        return annotation
+    try:
+        return _unwrap_base_type(annotation)
+    except TypeError:  # unhashable annotation - unwrap without the cache
         base_type, _, _ = unwrap_annotation(annotation)
         return base_type
-    return annotation
 
 
 # Define this variable at the module level
 T = TypeVar("T")
 
+
+class _FieldStub:
+  """Lightweight dataclass-field record used for the IDE/type-checker shims.
+
+  A shared ``__slots__`` class: the previous per-field ``type('Field', ...)``
+  calls created a whole new class object (with its own dict) for every
+  field of every spec.
+  """
+  __slots__ = ("name", "type", "default", "default_factory", "init", "repr", "compare", "metadata", "hash")
+
+  def __init__(self, name, type_, default=None, default_factory=None, init=True,
+               repr_=True, compare=True, metadata=None, hash_=True):
+    self.name = name
+    self.type = type_
+    self.default = default
+    self.default_factory = default_factory
+    self.init = init
+    self.repr = repr_
+    self.compare = compare
+    self.metadata = {} if metadata is None else metadata
+    self.hash = hash_
+
+
+class _AttrStub:
+  """Minimal attrs-style attribute record for the ``__attrs_attrs__`` shim."""
+  __slots__ = ("name", "type")
+
+  def __init__(self, name, type_):
+    self.name = name
+    self.type = type_
+
+
 def annotate_spec(cls: type[T]) -> type[T]:
     """Annotate a spec class with IDE-friendly metadata.
     
@@ -58,19 +171,14 @@ def annotate_spec(cls: type[T]) -> type[T]:
         # PyCharm/VSCode attribute inspection
         if not hasattr(cls, "__dataclass_fields__"):
             annotations = getattr(cls, "__annotations__", {})
+            cls_vars = {}
+            for base in reversed(cls.__mro__):
+                cls_vars.update(vars(base))
             dataclass_fields = {}
             for field_name, field_type in annotations.items():
-                field_obj = type('Field', (), {
-                    'name': field_name,
-                    'type': field_type,
-                    'default': getattr(cls, field_name, None),
-                    'default_factory': None,
-                    'init': True,
-                    'repr': True, 
-                    'compare': True,
-                    'hash': True,
-                })
-                dataclass_fields[field_name] = field_obj
+                dataclass_fields[field_name] = _FieldStub(
+                    field_name, field_type, default=cls_vars.get(field_name)
+                )
             setattr(cls, "__dataclass_fields__", dataclass_fields)
             
         # Make it look like a standard class with variables
@@ -90,7 +198,7 @@ T = TypeVar("T")
 # Utility functions for data conversion
 def fromdict(data: dict[str, Any], cls: type[T]) -> T:
     """Convert a dictionary to an instance of the specified class."""
-    return msgspec.convert(data, cls, dec_hook=default_deserializer)
+    return _convert(data, cls)
 
 
 def asdict(obj: Any) -> dict[str, Any]:
@@ -100,8 +208,13 @@ def asdict(obj: Any) -> dict[str, Any]:
 
 def asjson(obj: Any, *, indent: int | None = None) -> bytes:
     """Convert an object to JSON bytes."""
-    # First encode the object to JSON bytes
-    json_bytes = msgspec.json.encode(obj, enc_hook=default_serializer)
+    # Indented output goes through a dedicated encoder when msgspec can
+    # indent in a single pass; otherwise fall back to encode-then-format
+    if indent is not None and _ENCODER_SUPPORTS_INDENT:
+        return _indent_encoder(indent).encode(obj)
+
+    # Encode the object to JSON bytes via the shared encoder
+    json_bytes = _json_encoder.encode(obj)
 
     # If indent is specified, use format to make it pretty
     if indent is not None:
@@ -111,28 +224,91 @@ def asjson(obj: Any, *, indent: int | None = None) -> bytes:
     return json_bytes
 
 
+def asmsgpack(obj: Any) -> bytes:
+    """Convert an object to MessagePack bytes."""
+    return _msgpack_encoder.encode(obj)
+
+
 def fromjson(json_str: str | bytes, cls: type[T]) -> T:
     """Convert a JSON string to an instance of the specified class."""
-    return msgspec.json.decode(json_str, type=cls, dec_hook=default_deserializer)
+    return _json_decoder(cls).decode(json_str)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_decoder(cls: type) -> "msgspec.json.Decoder":
+    return msgspec.json.Decoder(list[cls], dec_hook=default_deserializer)
+
+
+def fromjson_many(json_str: str | bytes, cls: type[T]) -> list[T]:
+    """Decode a JSON array into a list of instances of the specified class.
+
+    One C-level decode validates the whole batch, instead of N ``fromjson``
+    calls with N rounds of Python dispatch.
+    """
+    return _list_decoder(cls).decode(json_str)
+
+
+def asjson_many(objs: list[Any] | tuple[Any, ...]) -> bytes:
+    """Convert a sequence of objects to a JSON array in a single encode."""
+    return _json_encoder.encode(objs)
+
+
+def frommsgpack(data: bytes, cls: type[T]) -> T:
+    """Convert MessagePack bytes to an instance of the specified class."""
+    return _msgpack_decoder(cls).decode(data)
+
+
+# pyyaml is optional - imported once on first use, cached in module globals
+# together with the private Dumper the struct representers hang off
+_yaml = None
+_yaml_dumper = None
+
+
+def _get_yaml():
+    """Return the ``yaml`` module, importing it on first call."""
+    global _yaml, _yaml_dumper
+    if _yaml is None:
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("pyyaml is required for YAML support")
+
+        # a private Dumper subclass keeps our representers out of the
+        # process-wide yaml.Dumper registry other libraries share
+        class SpecDumper(yaml.SafeDumper):
+            pass
+
+        # dump structs field-by-field instead of materializing an
+        # intermediate dict tree via asdict() first
+        SpecDumper.add_multi_representer(
+            msgspec.Struct,
+            lambda dumper, data: dumper.represent_mapping(
+                "tag:yaml.org,2002:map",
+                [(name, getattr(data, name)) for name in data.__struct_fields__],
+            ),
+        )
+        # leaf values yaml doesn't know natively go through the same
+        # serializer as JSON output (SecretStr stays obscured, unsupported
+        # types still raise TypeError instead of being pickled)
+        SpecDumper.add_multi_representer(
+            object,
+            lambda dumper, data: dumper.represent_data(default_serializer(data)),
+        )
+        _yaml = yaml
+        _yaml_dumper = SpecDumper
+    return _yaml
 
 
 def asyaml(obj: Any, *, indent: int = 2) -> str:
     """Convert an object to a YAML string."""
-    try:
-        import yaml
-        return yaml.dump(asdict(obj), indent=indent, sort_keys=False)
-    except ImportError:
-        raise ImportError("pyyaml is required for YAML support")
+    yaml = _get_yaml()
+    return yaml.dump(obj, Dumper=_yaml_dumper, indent=indent, sort_keys=False)
 
 
 def fromyaml(yaml_str: str, cls: type[T]) -> T:
     """Convert a YAML string to an instance of the specified class."""
-    try:
-        import yaml
-        data = yaml.safe_load(yaml_str)
-        return fromdict(data, cls)
-    except ImportError:
-        raise ImportError("pyyaml is required for YAML support")
+    yaml = _get_yaml()
+    return fromdict(yaml.safe_load(yaml_str), cls)
 
 
 # -----------------------------------------------------------------------------
@@ -144,6 +320,10 @@ class Field:
   
   This class helps define fields with validations and constraints.
   """
+  # one Field per declared field across every spec class - keep them
+  # __dict__-free
+  __slots__ = ("default", "constraints", "field_kwargs", "rule", "coerce", "type", "name", "metadata")
+
   def __init__(
       self,
       default: Any = ...,
@@ -217,6 +397,10 @@ class Field:
 Unknown = EllipsisType
 
 
+# every keyword that maps 1:1 onto a msgspec.Meta constraint
+_CONSTRAINT_KEYS = ("gt", "ge", "lt", "le", "min_length", "max_length", "pattern", "description", "multiple_of", "tz")
+
+
 def field(
   default: T | Unknown = ...,
   rule: Callable[[T], bool | None] | None = None,
@@ -236,28 +420,10 @@ def field(
   tz: bool | None = None,
   description: str | None = None,
 ) -> Field:
-  # Save constraints and defer conversion to Annotated
-  constraints = {}
-  if gt is not None:
-    constraints["gt"] = gt
-  if ge is not None:
-    constraints["ge"] = ge
-  if lt is not None:
-    constraints["lt"] = lt
-  if le is not None:
-    constraints["le"] = le
-  if min_length is not None:
-    constraints["min_length"] = min_length
-  if max_length is not None:
-    constraints["max_length"] = max_length
-  if pattern is not None:
-    constraints["pattern"] = pattern
-  if description is not None:
-    constraints["description"] = description
-  if multiple_of is not None:
-    constraints["multiple_of"] = multiple_of
-  if tz is not None:
-    constraints["tz"] = tz
+  # Save constraints and defer conversion to Annotated: one dict-comp over
+  # locals() instead of a None-check branch per keyword
+  passed = locals()
+  constraints = {k: passed[k] for k in _CONSTRAINT_KEYS if passed[k] is not None}
 
   # if rule has a message, wrap it in a Rule object
   if rule is not None and message is not None:
@@ -280,55 +446,63 @@ def field(
 
 
 class Rule:
+  __slots__ = ("expr", "bind", "message", "_fn", "_located", "filename", "lineno", "source")
+
   def __init__(self, expr, bind=None, message=None):
     self.expr = expr
     self.bind = bind
     self.message = message
-    
-    # Capture location information for better error messages
-    try:
-      if inspect.isfunction(expr) or isinstance(expr, type(lambda: None)):
-        frame = inspect.currentframe().f_back.f_back  # Two frames back to get caller of rule()
-        self.filename = frame.f_code.co_filename
-        self.lineno = frame.f_lineno
-        # Try to get source if it's a lambda
-        if isinstance(expr, type(lambda: None)):
-          try:
-            source_lines, start_line = inspect.getsourcelines(frame)
-            # Find the line with "lambda" in it near our line number
-            for i, line in enumerate(source_lines):
-              if "lambda" in line and i + start_line <= frame.f_lineno:
-                self.source = line.strip()
-                break
-          except Exception:
-            self.source = str(expr)
-        else:
-          self.source = str(expr)
-    except Exception:
-      self.filename = None
-      self.lineno = None
-      self.source = str(expr)
+
+    # Compile the evaluation into a single callable up front so `__call__`
+    # pays no per-invocation branching: when `bind` is set, the attribute
+    # access is baked in via C-level `operator.attrgetter`.
+    if bind:
+      self._fn = lambda inst, _get=operator.attrgetter(bind), _expr=expr: _expr(_get(inst))
+    else:
+      self._fn = expr
+
+    # Location info is only needed for error messages - capture it lazily
+    # the first time a rule actually fails instead of paying frame walks
+    # and source-file I/O on every rule construction
+    self._located = False
+    self.filename = None
+    self.lineno = None
+    self.source = None
+
+  def _capture_location(self):
+    """Resolve filename/line/source for error messages (cold path)."""
+    self._located = True
+    code = getattr(self.expr, "__code__", None)
+    if code is not None:
+      self.filename = code.co_filename
+      self.lineno = code.co_firstlineno
+      line = linecache.getline(self.filename, self.lineno)
+      self.source = line.strip() if line else str(self.expr)
+    else:
+      self.source = str(self.expr)
 
   def __call__(self, inst):
-    inst = inst if not self.bind else getattr(inst, self.bind)
-    
     try:
-      ok = self.expr(inst)
-      
+      ok = self._fn(inst)
+
       if ok is None or ok:
         return True
-        
-      error_message = self.message or f"Rule failed: {self.source if hasattr(self, 'source') else self.expr}"
-      if hasattr(self, 'filename') and hasattr(self, 'lineno') and self.filename and self.lineno:
+
+      if not self._located:
+        self._capture_location()
+      error_message = self.message or f"Rule failed: {self.source or self.expr}"
+      if self.filename and self.lineno:
         error_message += f" (defined at {self.filename}:{self.lineno})"
-        
+
       raise ValueError(error_message)
-      
+
     except Exception as e:
       if not isinstance(e, ValueError) and self.message:
         # If an exception occurred in the rule itself, wrap it with our message
+        if not self._located:
+          self._capture_location()
         error_message = f"{self.message} (rule execution failed: {e})"
-        if hasattr(self, 'filename') and hasattr(self, 'lineno') and self.filename and self.lineno:
+        if self.filename and self.lineno:
           error_message += f" (defined at {self.filename}:{self.lineno})"
         raise ValueError(error_message) from e
       raise
@@ -340,6 +514,24 @@ class Rule:
 _RULE_MARKER = "_marked_rule"
 
 
+def _register_rule(rule_obj: "Rule", depth: int = 2) -> None:
+  """Attach ``rule_obj`` to the enclosing class body, if there is one.
+
+  A decorator only sees the class after its body has finished executing,
+  so a context-variable stack has nowhere to be pushed from without
+  forcing a metaclass on users - the class namespace itself is the one
+  reliable channel. ``sys._getframe`` is used over
+  ``inspect.currentframe`` as it skips the inspect-module indirection.
+  """
+  try:
+    frame = sys._getframe(depth)
+  except ValueError:
+    return
+  f_locals = frame.f_locals
+  if f_locals is not None and "__module__" in f_locals:
+    f_locals.setdefault("__spec_rules__", []).append(rule_obj)
+
+
 def rule(expr=None, message: str | None = None):
   """Define a validation rule for a spec class.
 
@@ -360,67 +552,41 @@ def rule(expr=None, message: str | None = None):
   """
   # For lambdas and all callables in class body
   if expr is not None and callable(expr):
-    # Create a Rule object for the expression
+    # Create a Rule object for the expression and attach it to the class body
     rule_obj = Rule(expr, message=message)
-    
-    # Try to detect if we're in a class body
-    try:
-      frame = inspect.currentframe().f_back
-      if frame and frame.f_locals is not None:
-        # Look for signs we're in a class definition
-        if "__module__" in frame.f_locals:
-          # We're in a class definition, add to __spec_rules__
-          frame.f_locals.setdefault("__spec_rules__", []).append(rule_obj)
-    except Exception:
-      # Fallback in case of frame access issues
-      pass
-    
+    _register_rule(rule_obj)
+
     # If it's a method, mark it
     if inspect.ismethod(expr) or inspect.isfunction(expr):
       setattr(expr, _RULE_MARKER, True)
-      
-    return rule_obj if not (inspect.ismethod(expr) or inspect.isfunction(expr)) else expr
+      return expr
+    return rule_obj
 
   # if rule is called directly (rule(...))
   # or if it's used as a decorator with arguments
   if expr is None:
     # used as @rule() decorator with optional message
     def decorator(func):
-      # Create and attach rule
+      # Create, attach and mark the rule
       rule_obj = Rule(func, message=message)
-      
-      # Mark the function
       setattr(func, _RULE_MARKER, True)
-      
-      # Try to add to class body if in class definition
-      try:
-        frame = inspect.currentframe().f_back
-        if frame and frame.f_locals is not None:
-          if "__module__" in frame.f_locals:
-            frame.f_locals.setdefault("__spec_rules__", []).append(rule_obj)
-      except Exception:
-        pass
-        
+      _register_rule(rule_obj)
       return func
     return decorator
 
   # Direct rule in class body for non-callable expressions (rare)
-  try:
-    frame = inspect.currentframe().f_back
-    if frame and frame.f_locals is not None:
-      # We're in a class definition
-      local_vars = frame.f_locals
-      local_vars.setdefault("__spec_rules__", []).append(Rule(expr, message=message))
-  except Exception:
-    # Fallback in case of any frame access issues
-    pass
-
+  _register_rule(Rule(expr, message=message))
   return expr
 
 
 # -----------------------------------------------------------------------------
 # typecheck
 
+# authoritative str -> number coercions; anything else (including bool,
+# which has never been coerced from strings here) goes through msgspec
+_fast_coerce: dict[type, Callable[[str], Any]] = {int: int, float: float}
+
+
 def check(func, *, coerce=True):
   """Decorator that validates function arguments based on type annotations.
 
@@ -435,6 +601,10 @@ def check(func, *, coerce=True):
   Returns:
       A wrapped function with argument validation
 
+  Note:
+      Only arguments supplied by the caller are validated and coerced;
+      parameter defaults are trusted as written.
+
   Example:
       @check
       def calculate_area(width: PositiveInt, height: PositiveInt) -> float:
@@ -446,47 +616,88 @@ def check(func, *, coerce=True):
   if func is None:
     return functools.partial(check, coerce=coerce)
 
+  # reflection is paid once here, not per call: precompute the
+  # (position, name, annotation, base type) plan for annotated parameters
+  code = func.__code__
+  annotations = func.__annotations__
+  param_names = code.co_varnames[:code.co_argcount]
+  param_plan = tuple(
+    (i, name, annotations[name], get_base_type(annotations[name]))
+    for i, name in enumerate(param_names)
+    if name in annotations and name != "return"
+  )
+
+  def _check_value(value, expected_type, base_type):
+    # Dictionary isn't automatically converted to custom classes
+    if isinstance(value, dict) and inspect.isclass(base_type) and not issubclass(base_type, dict):
+        raise TypeError(f"Cannot convert dictionary to {base_type.__name__}")
+
+    # Handle string to scalar conversion if coerce=True - one dict hit
+    # instead of a branch per target type, and no msgspec roundtrip
+    if coerce and isinstance(value, str):
+        if (fn := _fast_coerce.get(base_type)) is not None:
+            try:
+                return fn(value)
+            except (ValueError, TypeError):
+                pass
+
+    # Let msgspec handle the validation and conversion
+    try:
+        return _convert(value, expected_type)
+    except Exception:
+        if isinstance(value, (int, float, str, bool)) and not isinstance(value, base_type):
+            # More friendly error for simple type mismatches
+            raise TypeError(f"Cannot convert {type(value).__name__} to {base_type.__name__}: {value}")
+        raise  # Re-raise original exception
+
+  # functions with *args/**kwargs or keyword-only parameters keep the
+  # general Signature.bind path; plain signatures get the fast wrapper
+  has_special_params = bool(code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)) or code.co_kwonlyargcount > 0
+
+  if not has_special_params:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+      nargs = len(args)
+      converted_args = None
+      for i, name, expected_type, base_type in param_plan:
+        if i < nargs:
+          value = args[i]
+          new = _check_value(value, expected_type, base_type)
+          if new is not value:
+            if converted_args is None:
+              converted_args = list(args)
+            converted_args[i] = new
+        elif name in kwargs:
+          value = kwargs[name]
+          new = _check_value(value, expected_type, base_type)
+          if new is not value:
+            kwargs[name] = new
+        # unfilled parameters take their (already trusted) defaults
+      return func(*(converted_args if converted_args is not None else args), **kwargs)
+
+    return wrapper
+
+  sig = inspect.signature(func)
+
+  # the positional plan misses keyword-only parameters - extend it for the
+  # bind path, which addresses arguments by name anyway
+  kwonly_names = code.co_varnames[code.co_argcount:code.co_argcount + code.co_kwonlyargcount]
+  bind_plan = param_plan + tuple(
+    (None, name, annotations[name], get_base_type(annotations[name]))
+    for name in kwonly_names
+    if name in annotations and name != "return"
+  )
+
   @functools.wraps(func)
   def wrapper(*args, **kwargs):
-    sig = inspect.signature(func)
     bound = sig.bind(*args, **kwargs)
-    bound.apply_defaults()
-
-    annotations = func.__annotations__
-
-    for name, value in bound.arguments.items():
-      if name in annotations and name != 'return':
-        expected_type = annotations[name]
-        base_type = get_base_type(expected_type)
-
-        # Dictionary isn't automatically converted to custom classes
-        if isinstance(value, dict) and inspect.isclass(base_type) and not issubclass(base_type, dict):
-            raise TypeError(f"Cannot convert dictionary to {base_type.__name__}")
-
-        # Handle string to numeric conversion if coerce=True
-        if coerce and isinstance(value, str):
-            if base_type is int:
-                try:
-                    bound.arguments[name] = int(value)
-                    continue
-                except (ValueError, TypeError):
-                    pass
-            elif base_type is float:
-                try:
-                    bound.arguments[name] = float(value)
-                    continue
-                except (ValueError, TypeError):
-                    pass
-
-        # Let msgspec handle the validation and conversion
-        try:
-            converted = msgspec.convert(value, expected_type, dec_hook=default_deserializer)
-            bound.arguments[name] = converted
-        except Exception as e:
-            if isinstance(value, (int, float, str, bool)) and not isinstance(value, base_type):
-                # More friendly error for simple type mismatches
-                raise TypeError(f"Cannot convert {type(value).__name__} to {base_type.__name__}: {value}")
-            raise  # Re-raise original exception
+
+    for _, name, expected_type, base_type in bind_plan:
+      if name in bound.arguments:
+        value = bound.arguments[name]
+        new = _check_value(value, expected_type, base_type)
+        if new is not value:
+          bound.arguments[name] = new
 
     return func(*bound.args, **bound.kwargs)
 
@@ -499,16 +710,129 @@ def check(func, *, coerce=True):
 T = TypeVar("T")
 
 
+def _batch_from_list(cls, items: list) -> list:
+  """Build a list of instances from a list of dicts in one native decode.
+
+  A ``msgspec.json.Decoder(list[cls])`` is compiled lazily and cached on
+  the class, so validating N items costs one C-level call instead of N
+  Python-level constructions. Rules still run per instance via
+  ``__post_init__`` during the decode.
+  """
+  decoder = cls.__dict__.get("__batch_decoder__")
+  if decoder is None:
+    decoder = msgspec.json.Decoder(list[cls], dec_hook=default_deserializer)
+    cls.__batch_decoder__ = decoder
+  return decoder.decode(msgspec.json.encode(items, enc_hook=default_serializer))
+
+
+def _codegen_post_init(cls, spec_type_tuples, convert_hints, coerce_fields, convert_payload,
+                       spec_rules=(), method_rules=()):
+  """Build an unrolled ``__post_init__`` specialized for ``cls``.
+
+  Emits one straight-line block per field mirroring the generic validation
+  loop, compiles it once, and returns the function (or ``None`` when the
+  source can't be compiled, in which case the generic loop is used).
+  Rules are inlined as one call per rule instead of a dispatch loop, and
+  the user post-init call is only emitted when the class has one, so
+  unused features cost nothing per instance.
+  """
+  ns = {
+    "_convert_payload": convert_payload,
+  }
+  lines = ["def __post_init__(self):", "  payload = None"]
+
+  def collect(key, indent):
+    # append the "field still needs conversion" bookkeeping at the given depth
+    pad = " " * indent
+    lines.append(f"{pad}if payload is None: payload = {{}}")
+    lines.append(f"{pad}payload[{key!r}] = raw")
+
+  for key, T in spec_type_tuples:
+    if key not in convert_hints:
+      continue  # ClassVar and friends are never converted
+    base_type = get_base_type(T)
+    lines.append(f"  raw = self.{key}")
+
+    if key in coerce_fields:
+      if base_type in (int, float):
+        # manual str -> number fast path, falling back to msgspec
+        ns[f"_c_{key}"] = base_type
+        lines.append("  if isinstance(raw, str):")
+        lines.append("    try:")
+        lines.append(f"      self.{key} = _c_{key}(raw)")
+        lines.append("    except (ValueError, TypeError):")
+        collect(key, 6)
+        lines.append("  else:")
+        collect(key, 4)
+      else:
+        collect(key, 2)
+      continue
+
+    origin_type = get_origin(base_type)
+    if inspect.isclass(base_type) and origin_type is None:
+      # bare classes can never make isinstance raise: type-identity first
+      # (pointer compare), isinstance only on miss
+      ns[f"_b_{key}"] = base_type
+      lines.append(f"  if type(raw) is not _b_{key} and not isinstance(raw, _b_{key}):")
+      collect(key, 4)
+    elif inspect.isclass(origin_type) and origin_type not in UnionTypes and get_origin(origin_type) is None:
+      # subscripted generics: match against the bare origin like the loop does
+      ns[f"_o_{key}"] = origin_type
+      lines.append(f"  if not isinstance(raw, _o_{key}):")
+      collect(key, 4)
+    else:
+      # Unions and friends: whether isinstance is even legal depends on the
+      # runtime value, so keep the interpreted loop's guarded probe
+      ns[f"_b_{key}"] = base_type
+      lines.append("  try:")
+      lines.append(f"    _ok = isinstance(raw, _b_{key})")
+      lines.append("  except TypeError:")
+      lines.append("    _ok = False")
+      lines.append("  if not _ok:")
+      collect(key, 4)
+
+  lines += [
+    "  if payload is not None:",
+    "    _convert_payload(self, payload)",
+  ]
+  # rules are inlined as straight-line calls rather than looped over -
+  # each one is a pre-bound global in the exec namespace
+  for i, r in enumerate(spec_rules):
+    ns[f"_r{i}"] = r
+    lines.append(f"  _r{i}(self)")
+  for i, m in enumerate(method_rules):
+    ns[f"_m{i}"] = m
+    lines.append(f"  _m{i}(self)")
+  user_post = getattr(cls, "__post_init__", None)
+  if user_post is not None:
+    ns["_user_post"] = user_post
+    lines.append("  _user_post(self)")
+
+  try:
+    code = compile("\n".join(lines), f"<spec:{cls.__name__}>", "exec")
+    exec(code, ns)
+  except Exception:
+    return None
+  return ns["__post_init__"]
+
+
 # Apply dataclass_transform to help IDEs understand our class transformer
 @dataclass_transform(
     field_specifiers=(Field, field),
     kw_only_default=False,
 )
-def spec(cls: type[T]) -> type[T]:
+def spec(cls: type[T] | None = None, *, ide_hints: bool | None = None) -> type[T]:
   """Class decorator that transforms a regular class into a validated specification.
 
   The decorated class becomes a msgspec.Struct with validation, coercion and rule checking.
-  
+
+  Args:
+      cls: The class to transform (omitted when called with keyword arguments).
+      ide_hints: Attach the IDE/type-checker compatibility shims
+          (``__attrs_attrs__``, ``__pydantic_model__``, per-field markers, ...).
+          Defaults to the ``SPECTIC_IDE_HINTS`` environment variable (on unless
+          set to ``0``/``false``); pass ``False`` to keep generated classes lean.
+
   Example:
       ```python
       @spec
@@ -521,11 +845,14 @@ def spec(cls: type[T]) -> type[T]:
       user = User(name="John", email="john@example.com", age=30)
       ```
   """
-  # For type checkers, create a class template
-  spec_class_template = {}
-
-  # Extract rules - get the rules defined in class namespace
-  namespace = cls.__dict__.copy()
+  if cls is None:  # called as @spec(ide_hints=...)
+    return functools.partial(spec, ide_hints=ide_hints)
+  if ide_hints is None:
+    ide_hints = _IDE_HINTS_DEFAULT
+
+  # Extract rules - get the rules defined in class namespace (the
+  # mappingproxy is read directly; nothing below mutates it)
+  namespace = cls.__dict__
   spec_rules = []
 
   # Get rules directly from the class's __spec_rules__ attribute if present
@@ -536,25 +863,38 @@ def spec(cls: type[T]) -> type[T]:
     spec_rules.extend(namespace["__rules__"])
 
   # Also add any rules created via rule(...) calls in the class body
-  for key, value in list(namespace.items()):
+  for key, value in namespace.items():
     if key.startswith("__rule_") and isinstance(value, Rule):
       spec_rules.append(value)
 
-  # find @rule methods
+  # find @rule methods - walk the MRO class dicts directly; unlike
+  # inspect.getmembers this neither sorts attributes nor triggers
+  # descriptors (properties) along the way
   method_rules = []
-  for name, mem in inspect.getmembers(cls):
-    if callable(mem) and hasattr(mem, _RULE_MARKER) and getattr(mem, _RULE_MARKER, False):
-      method_rules.append(mem)
-
-  # type hints
-  hints = get_type_hints(cls, include_extras=True)
+  seen = set()
+  for base in cls.__mro__:
+    for name, mem in vars(base).items():
+      if name in seen:
+        continue
+      seen.add(name)
+      if callable(mem) and getattr(mem, _RULE_MARKER, False):
+        method_rules.append(mem)
+
+  # type hints (memoized - repeated decoration of the same class is free)
+  hints = _class_hints(cls)
   attrs = {}  # {name: (type, default/field)}
   msgspec_fields = {}
   coerce_fields = set()  # track fields that should be coerced
 
+  # merge the MRO class dicts once so per-field default lookup is a plain
+  # dict hit rather than a descriptor-aware getattr walk
+  cls_vars: dict[str, Any] = {}
+  for base in reversed(cls.__mro__):
+    cls_vars.update(vars(base))
+
   # collect field info
   for key, T in hints.items():
-    default = getattr(cls, key, Ellipsis)
+    default = cls_vars.get(key, Ellipsis)
     info = None
     if isinstance(default, Field):
       rule = default.rule
@@ -566,7 +906,7 @@ def spec(cls: type[T]) -> type[T]:
       info.name = key
       
       if info.constraints:
-        T = Annotated[T, msgspec.Meta(**info.constraints)]
+        T = Annotated[T, _intern_meta(tuple(sorted(info.constraints.items())))]
       if rule:
         spec_rules.append(Rule(rule, bind=key))
       if info.coerce:
@@ -577,17 +917,86 @@ def spec(cls: type[T]) -> type[T]:
       msgspec_fields[key] = msgspec.field()
     attrs[key] = (T, default)
 
-    # Add field to class template for static type checking
-    spec_class_template[key] = T
+  # collect the convertible fields into a single TypedDict so all pending
+  # conversions can be handed to msgspec in one C-level call (converting
+  # against the Struct type itself would re-enter __post_init__)
+  convert_hints = {
+    key: T for key, (T, _) in attrs.items()
+    if get_origin(T) not in (ClassVar, type, Any)
+  }
+  convert_type = TypedDict(f"_{cls.__name__}Fields", convert_hints, total=False)
+
+  # pre-interned (name, type) pairs: interned keys make every getattr/setattr
+  # below a pointer-compare dict hit, and the tuple spares re-iterating
+  # __annotations__ on each construction
+  spec_type_tuples = tuple((sys.intern(key), T) for key, (T, _) in attrs.items())
+
+  # fields annotated with a bare class (no Annotated meta, so nothing to
+  # validate beyond the type itself) can be skipped with a single
+  # type-identity check; Annotated/generic forms never enter this map
+  fast_types = {
+    key: T for key, T in spec_type_tuples
+    if T in (int, str, float, bool, bytes)
+    or (inspect.isclass(T) and get_origin(T) is None)
+  }
+
+  def _convert_payload(self, payload: dict) -> None:
+    # batch conversion through msgspec - one native call for all fields,
+    # with `$.field` error locations reported by msgspec itself
+    try:
+      converted = _convert(payload, convert_type)
+    except (TypeError, ValueError) as e:
+      if not isinstance(e, msgspec.ValidationError) and (
+        "ClassVar" in str(e) or "is not supported" in str(e)
+      ):
+        # some annotation msgspec can't handle - fall back to field-by-field,
+        # with one outer handler wrapping the failing field instead of a
+        # try/except per iteration
+        converted = {}
+        current = None
+        try:
+          for current, raw in payload.items():
+            try:
+              converted[current] = _convert(raw, self.__annotations__[current])
+            except (TypeError, ValueError) as fe:
+              if isinstance(fe, msgspec.ValidationError):
+                raise
+              if "ClassVar" in str(fe) or "is not supported" in str(fe):
+                continue  # Skip unsupported types
+              raise
+        except msgspec.ValidationError as fe:
+          raise msgspec.ValidationError(str(fe) + f" - at `$.{current}`")  # noqa: mimic original exceptions
+      else:
+        raise
+    for key, value in converted.items():
+      if value is not payload[key]:  # only set if value actually changed
+        setattr(self, key, value)
+
+  # resolve the user's post-init hook once - cls never changes, so there is
+  # no reason to re-do the getattr on every construction
+  user_post_init = getattr(cls, "__post_init__", None)
+
+  # full per-field plan: every decision the loop needs (base type, fast
+  # type, coercion and convertibility flags) is taken here, once
+  field_plan = tuple(
+    (key, T, get_base_type(T), fast_types.get(key), key in coerce_fields, key in convert_hints)
+    for key, T in spec_type_tuples
+  )
+
+  # both rule kinds collapse into one tuple; the common one-rule case is
+  # specialized into a direct call with no loop at all
+  _all_rules = (*spec_rules, *method_rules)
+  _single_rule = _all_rules[0] if len(_all_rules) == 1 else None
 
   def __post_init__(self) -> None:
-    # validate and coerce fields as needed
-    for key, T in self.__annotations__.items():
+    # gather only the fields that still need conversion/validation
+    payload = None
+    for key, T, base_type, ft, should_coerce, convertible in field_plan:
       raw = getattr(self, key)
-      should_coerce = key in coerce_fields
 
-      # get the base type using our utility function
-      base_type = get_base_type(T)
+      # exact-type fast path: unconstrained builtins need no conversion
+      if ft is not None and type(raw) is ft:
+        continue
 
       # skip conversion if type matches and coercion not forced
       if not should_coerce:
@@ -602,7 +1011,7 @@ def spec(cls: type[T]) -> type[T]:
             origin_type = get_origin(base_type)
             if origin_type and isinstance(raw, origin_type):
               continue
-              
+
             # Special case for basic types that are commonly used
             if base_type in (str, int, float, bool, list, dict, set, tuple) and isinstance(raw, base_type):
               continue
@@ -610,54 +1019,54 @@ def spec(cls: type[T]) -> type[T]:
             # If we still can't check, let the conversion happen
             pass
 
-      # always try to convert, which will also validate
-      try:
-        # Skip ClassVar and similar utility types
-        if get_origin(T) in (ClassVar, type, Any):
-          continue
-            
-        # handle string to number conversion manually if coercion requested
-        if should_coerce and isinstance(raw, str):
-          if base_type is int:
-            try:
-              value = int(raw)
-              setattr(self, key, value)
-              continue
-            except (ValueError, TypeError):
-                pass  # Fall back to msgspec conversion
-          elif base_type is float:
-            try:
-              value = float(raw)
-              setattr(self, key, value)
-              continue
-            except (ValueError, TypeError):
-                pass  # Fall back to msgspec conversion
+      # Skip ClassVar and similar utility types
+      if not convertible:
+        continue
 
-        # standard conversion through msgspec
-        try:
-          value = msgspec.convert(raw, T, dec_hook=default_deserializer)
-          if value is not raw:  # only set if value actually changed
-            setattr(self, key, value)
-        except (TypeError, ValueError) as e:
-          if "ClassVar" in str(e) or "is not supported" in str(e):
-            # Skip unsupported types
+      # handle string to number conversion manually if coercion requested
+      if should_coerce and isinstance(raw, str):
+        if base_type is int:
+          try:
+            setattr(self, key, int(raw))
             continue
-          raise
-      except msgspec.ValidationError as e:
-        raise msgspec.ValidationError(str(e) + f" - at `$.{key}`")  # noqa: mimic original exceptions
-
-    # Apply all rules - keep this for backward compatibility
-    # In case SpecStruct.__post_init__ is not called
-    for r in self.__rules__:
+          except (ValueError, TypeError):
+              pass  # Fall back to msgspec conversion
+        elif base_type is float:
+          try:
+            setattr(self, key, float(raw))
+            continue
+          except (ValueError, TypeError):
+              pass  # Fall back to msgspec conversion
+
+      if payload is None:
+        payload = {}
+      payload[key] = raw
+
+    if payload is not None:
+      _convert_payload(self, payload)
+
+    # Apply all rules - merged into one decoration-time tuple so a single
+    # loop (or direct call for the one-rule case) covers both kinds
+    if _single_rule is not None:
+      _single_rule(self)
+    elif _all_rules:
+      for r in _all_rules:
         r(self)
 
-    # Apply method rules
-    for rm in self.__method_rules__:
-        rm(self)
-    
     # run user's __post_init__ if it exists
-    if __user_post_init__ := getattr(cls, "__post_init__", None):
-      __user_post_init__(self)
+    if user_post_init is not None:
+      user_post_init(self)
+
+  # for small structs, unroll the per-field scan into straight-line code:
+  # CPython then executes a flat LOAD_FAST/compare sequence with no loop,
+  # dict iteration or per-field dispatch overhead per instance
+  if len(spec_type_tuples) <= 16:
+    generated = _codegen_post_init(
+      cls, spec_type_tuples, convert_hints, coerce_fields, _convert_payload,
+      spec_rules, method_rules,
+    )
+    if generated is not None:
+      __post_init__ = generated
 
   # build new Struct class using our SpecStruct as the base
   try:
@@ -667,112 +1076,95 @@ def spec(cls: type[T]) -> type[T]:
     # Fallback to standard msgspec.Struct if our implementation isn't available
     bases = (msgspec.Struct,)
 
+  # one annotations dict serves every projection that used to be rebuilt
+  # per consumer (__annotations__, __type_hints__, the old class template)
+  annotations = {key: T for key, (T, _) in attrs.items()}
+
   __dict__ = {
     "__module__": cls.__module__,
     "__doc__": cls.__doc__,
-    # Keep both names for compatibility
-    "__spec_rules__": spec_rules,
-    "__rules__": spec_rules,
-    "__method_rules__": method_rules,
-    "__annotations__": {key: T for key, (T, _) in attrs.items()},
+    # Keep both names for compatibility; tuples - iteration is cheaper and
+    # the rule set is fixed once the class is built
+    "__spec_rules__": tuple(spec_rules),
+    "__rules__": tuple(spec_rules),
+    "__method_rules__": tuple(method_rules),
+    "__annotations__": annotations,
     "__post_init__": __post_init__,
     "__coerce_fields__": coerce_fields,
+    "__spec_field_names__": tuple(key for key, _ in spec_type_tuples),
+    "__spec_type_tuples__": spec_type_tuples,
+    "__spec_field_plan__": field_plan,
+    "from_list": classmethod(_batch_from_list),
     # Add help for static type checkers
-    "__type_hints__": spec_class_template,
+    "__type_hints__": annotations,
   }
   for key, (T, d) in attrs.items():
     __dict__[key] = d if d is not Ellipsis else msgspec_fields[key]
 
-  # Create the actual class
-  result_cls = type(cls.__name__, bases, __dict__)
+  # Type checkers like pyright use this to understand the structure
+  dataclass_fields = {}
+  for field_name, (field_type, default) in attrs.items():
+    dataclass_fields[field_name] = _FieldStub(
+      field_name, field_type, default=default if default is not Ellipsis else None
+    )
+  __dict__["__dataclass_fields__"] = dataclass_fields
+
+  # The remaining IDE/type-checker shims are opt-in: each one costs setup
+  # time and an attribute slot forever. When enabled they go into the
+  # namespace up front - one dict build and a single type() call instead
+  # of a post-creation setattr (and a StructMeta dispatch) per attribute.
+  if ide_hints:
+    # Create a class_getitem method that allows IDE autocompletion via Generic[T] pattern
+    def class_getitem(cls, params):
+      # This is needed for type checking with subscripted types
+      return cls
+
+    # Add a custom __init_subclass__ that copies annotations
+    def __init_subclass__(cls, **kwargs):
+      super(result_cls, cls).__init_subclass__(**kwargs)
+      # Copy annotations to help type checkers
+      parent_annotations = getattr(result_cls, "__annotations__", {})
+      cls_annotations = getattr(cls, "__annotations__", {})
+      for name, type_hint in parent_annotations.items():
+        if name not in cls_annotations:
+          cls_annotations[name] = type_hint
+      setattr(cls, "__annotations__", cls_annotations)
+
+    # Add methods to support various type checking protocols
+    def __get_type_hints(cls):
+      return {k: v for k, (v, _) in attrs.items()}
+
+    # Support pydantic compatibility for PyCharm
+    def __get_validators__(cls):
+      return []
+
+    __dict__.update({
+      # makes the class appear properly typed to static type checkers
+      "__orig_bases__": (msgspec.Struct,),
+      "__class_getitem__": classmethod(class_getitem),
+      "__init_subclass__": classmethod(__init_subclass__),
+      # PyCharm specific
+      "__pydantic_model__": True,
+      # mypy plugin pattern
+      "__origin__": cls,
+      "__mypyc_attrs__": {k: v for k, (v, _) in attrs.items()},
+      "__get_type_hints__": classmethod(__get_type_hints),
+      "__get_validators__": classmethod(__get_validators__),
+      # attrs typing pattern
+      "__attrs_attrs__": [_AttrStub(k, v) for k, (v, _) in attrs.items()],
+    })
 
-  # Add type checking hints via __class_getitem__ to make the class appear
-  # like it has proper typing to static type checkers
-  result_cls.__orig_bases__ = (msgspec.Struct,)
+    # Add field class variables - helps static type checkers
+    for field_name, (field_type, _) in attrs.items():
+      __dict__[f"__field_{field_name}__"] = field_type
 
   # Copy attributes from original class to help with type checking
   for key, value in cls.__dict__.items():
     if key.startswith("__") and key.endswith("__"):
       continue  # Skip dunder methods/attributes
-    if key not in result_cls.__dict__:
-      setattr(result_cls, key, value)
+    __dict__.setdefault(key, value)
+
+  # Create the actual class
+  result_cls = type(cls.__name__, bases, __dict__)
 
-  # Since msgspec.StructMeta is immutable, we can't modify it directly.
-  # Instead, we'll set hints via other mechanisms that IDEs look for.
-  
-  # Create a class_getitem method that allows IDE autocompletion via Generic[T] pattern
-  def class_getitem(cls, params):
-    # This is needed for type checking with subscripted types
-    return cls
-    
-  result_cls.__class_getitem__ = classmethod(class_getitem)
-  
-  # Type checkers like pyright use this to understand the structure
-  dataclass_fields = {}
-  for field_name, (field_type, default) in attrs.items():
-    field_obj = type('Field', (), {
-      'name': field_name,
-      'type': field_type,
-      'default': default if default is not Ellipsis else None,
-      'default_factory': None,
-      'init': True,
-      'repr': True,
-      'compare': True,
-      'metadata': {},
-      'hash': True,
-    })
-    dataclass_fields[field_name] = field_obj
-  
-  setattr(result_cls, "__dataclass_fields__", dataclass_fields)
-  
-  # Add class annotations for IDE support
-  annotations = {}
-  for field_name, (field_type, _) in attrs.items():
-    annotations[field_name] = field_type
-  setattr(result_cls, "__annotations__", annotations)
-  
-  # Add a custom __init_subclass__ that copies annotations
-  def __init_subclass__(cls, **kwargs):
-    super(result_cls, cls).__init_subclass__(**kwargs)
-    # Copy annotations to help type checkers
-    parent_annotations = getattr(result_cls, "__annotations__", {})
-    cls_annotations = getattr(cls, "__annotations__", {})
-    for name, type_hint in parent_annotations.items():
-      if name not in cls_annotations:
-        cls_annotations[name] = type_hint
-    setattr(cls, "__annotations__", cls_annotations)
-  
-  setattr(result_cls, "__init_subclass__", classmethod(__init_subclass__))
-  
-  # Add various hints for different IDEs and type checkers
-  # PyCharm specific
-  setattr(result_cls, "__pydantic_model__", True)
-  
-  # Add field class variables - helps static type checkers
-  for field_name, (field_type, _) in attrs.items():
-    # This pattern is recognized by many type checkers
-    setattr(result_cls, f"__field_{field_name}__", field_type)
-  
-  # Support mypy plugin pattern
-  result_cls.__origin__ = cls
-  result_cls.__mypyc_attrs__ = {k: v for k, (v, _) in attrs.items()}
-  
-  # Add methods to support various type checking protocols
-  def __get_type_hints(cls):
-    return {k: v for k, (v, _) in attrs.items()}
-  
-  setattr(result_cls, "__get_type_hints__", classmethod(__get_type_hints))
-  
-  # Support pydantic compatibility for PyCharm
-  def __get_validators__(cls):
-    return []
-  
-  setattr(result_cls, "__get_validators__", classmethod(__get_validators__))
-  
-  # Support attrs typing pattern
-  result_cls.__attrs_attrs__ = [
-    type('Attribute', (), {'name': k, 'type': v})
-    for k, (v, _) in attrs.items()
-  ]
-  
   return result_cls
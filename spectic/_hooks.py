@@ -64,6 +64,11 @@ DEFAULT_TYPE_ENCODERS: TypeEncodersMap = {
 }
 
 
+# concrete type -> resolved encoder, populated on first encounter so the
+# common no-override path skips both the dict merge and the MRO walk
+_DEFAULT_CACHE: dict[type, Serializer] = {}
+
+
 def default_serializer(value: Any, type_encoders: Mapping[Any, Callable[[Any], Any]] | None = None) -> Any:
   """Transform values non-natively supported by ``msgspec``
 
@@ -75,18 +80,45 @@ def default_serializer(value: Any, type_encoders: Mapping[Any, Callable[[Any], A
   Raises:
       TypeError: if value is not supported
   """
-  type_encoders = {**DEFAULT_TYPE_ENCODERS, **(type_encoders or {})}
+  if type_encoders is None:
+    cls = value.__class__
+    encoder = _DEFAULT_CACHE.get(cls)
+    if encoder is not None:
+      return encoder(value)
+    for base in cls.__mro__[:-1]:
+      encoder = DEFAULT_TYPE_ENCODERS.get(base)
+      if encoder is not None:
+        _DEFAULT_CACHE[cls] = encoder
+        return encoder(value)
+    raise TypeError(f"Unsupported type: {type(value)!r}")
+
+  type_encoders = {**DEFAULT_TYPE_ENCODERS, **type_encoders}
 
   for base in value.__class__.__mro__[:-1]:
-    try:
-      encoder = type_encoders[base]
+    encoder = type_encoders.get(base)
+    if encoder is not None:
       return encoder(value)
-    except KeyError:
-      continue
 
   raise TypeError(f"Unsupported type: {type(value)!r}")
 
 
+def _decode_secret_bytes(value: Any) -> SecretBytes:
+  if isinstance(value, (bytes, str)):
+    return SecretBytes(value.encode("utf-8") if isinstance(value, str) else value)
+  raise TypeError(f"Unsupported type: {type(value)!r}")
+
+
+def _decode_secret_str(value: Any) -> SecretStr:
+  if isinstance(value, str):
+    return SecretStr(value)
+  raise TypeError(f"Unsupported type: {type(value)!r}")
+
+
+# target type -> transform, resolved once so repeat dec_hook calls replace
+# the issubclass chain with a single dict lookup
+_DECODER_CACHE: dict[Any, Callable[[Any], Any]] = {}
+
+
 def default_deserializer(
   target_type: Any, value: Any, type_decoders: TypeDecodersSequence | None = None
 ) -> Any:  # pragma: no cover
@@ -120,16 +152,19 @@ def default_deserializer(
       if predicate(target_type):
         return decoder(target_type, value)
 
-  if issubclass(target_type, (Path, PurePath, UUID)):
-    return target_type(value)
-
-  if issubclass(target_type, SecretBytes) and isinstance(value, (bytes, str)):
-    return SecretBytes(value.encode("utf-8") if isinstance(value, str) else value)
-
-  if issubclass(target_type, SecretStr) and isinstance(value, str):
-    return SecretStr(value)
+  decoder = _DECODER_CACHE.get(target_type)
+  if decoder is None:
+    if issubclass(target_type, (Path, PurePath, UUID)):
+      decoder = target_type
+    elif issubclass(target_type, SecretBytes):
+      decoder = _decode_secret_bytes
+    elif issubclass(target_type, SecretStr):
+      decoder = _decode_secret_str
+    else:
+      raise TypeError(f"Unsupported type: {type(value)!r}")
+    _DECODER_CACHE[target_type] = decoder
 
-  raise TypeError(f"Unsupported type: {type(value)!r}")
+  return decoder(value)
 
 
 _msgspec_json_encoder = msgspec.json.Encoder(enc_hook=default_serializer)
@@ -1,35 +1,69 @@
+import re
+
+from functools import lru_cache
 from typing import Annotated
 
 import msgspec
 
 
+@lru_cache(maxsize=None)
+def _meta(**constraints) -> msgspec.Meta:
+  """Return a shared ``msgspec.Meta`` for the given constraints.
+
+  Identical constraint sets (e.g. ``gt=0`` for both int and float aliases)
+  reuse one instance instead of allocating a Meta per alias.
+  """
+  return msgspec.Meta(**constraints)
+
+
 # -----------------------------------------------------------------------------
 # Numeric Types
 
-PositiveInt = Annotated[int, msgspec.Meta(gt=0)]
-NonNegativeInt = Annotated[int, msgspec.Meta(ge=0)]
-NegativeInt = Annotated[int, msgspec.Meta(lt=0)]
-NonPositiveInt = Annotated[int, msgspec.Meta(le=0)]
+PositiveInt = Annotated[int, _meta(gt=0)]
+NonNegativeInt = Annotated[int, _meta(ge=0)]
+NegativeInt = Annotated[int, _meta(lt=0)]
+NonPositiveInt = Annotated[int, _meta(le=0)]
 
-PositiveFloat = Annotated[float, msgspec.Meta(gt=0)]
-NonNegativeFloat = Annotated[float, msgspec.Meta(ge=0)]
-NegativeFloat = Annotated[float, msgspec.Meta(lt=0)]
-NonPositiveFloat = Annotated[float, msgspec.Meta(le=0)]
+PositiveFloat = Annotated[float, _meta(gt=0)]
+NonNegativeFloat = Annotated[float, _meta(ge=0)]
+NegativeFloat = Annotated[float, _meta(lt=0)]
+NonPositiveFloat = Annotated[float, _meta(le=0)]
 
 # -----------------------------------------------------------------------------
 # Common interval types for [0,1] and (0,1):
-ClosedUnitInterval = Annotated[float, msgspec.Meta(ge=0, le=1)]  # [0,1]
-OpenUnitInterval = Annotated[float, msgspec.Meta(gt=0, lt=1)]  # (0,1)
-LeftOpenUnitInterval = Annotated[float, msgspec.Meta(gt=0, le=1)]  # (0,1]
-RightOpenUnitInterval = Annotated[float, msgspec.Meta(ge=0, lt=1)]  # [0,1)
+ClosedUnitInterval = Annotated[float, _meta(ge=0, le=1)]  # [0,1]
+OpenUnitInterval = Annotated[float, _meta(gt=0, lt=1)]  # (0,1)
+LeftOpenUnitInterval = Annotated[float, _meta(gt=0, le=1)]  # (0,1]
+RightOpenUnitInterval = Annotated[float, _meta(ge=0, lt=1)]  # [0,1)
 
 # -----------------------------------------------------------------------------
 # String Types
 
-NonEmptyStr = Annotated[str, msgspec.Meta(pattern=r"^.*[^ ].*$")]
+# compiled once at import; the Meta pattern strings below stay the source of
+# truth for msgspec, these are the fast path for explicit bulk validation
+_NONEMPTY_RE = re.compile(r"^.*[^ ].*$")
+_EMAIL_RE = re.compile(r"^[^@ ]+@[^@ ]+\.[^@ ]+$")
+_HEX_RE = re.compile(r"^[0-9A-Fa-f]+$")
+
+NonEmptyStr = Annotated[str, _meta(pattern=_NONEMPTY_RE.pattern)]
 r"""str restricted to non-empty pattern ^.*[^ ].*$"""
 
-EmailStr = Annotated[str, msgspec.Meta(pattern=r"^[^@ ]+@[^@ ]+\.[^@ ]+$")]
+EmailStr = Annotated[str, _meta(pattern=_EMAIL_RE.pattern)]
 r"str restricted to the email pattern ^[^@ ]+@[^@ ]+\.[^@ ]+$"
 
-HexStr = Annotated[str, msgspec.Meta(pattern=r"^[0-9A-Fa-f]+$")]
+HexStr = Annotated[str, _meta(pattern=_HEX_RE.pattern)]
+
+
+def validate_nonempty(value: str) -> bool:
+  """Check ``value`` against the ``NonEmptyStr`` pattern without msgspec."""
+  return _NONEMPTY_RE.fullmatch(value) is not None
+
+
+def validate_email(value: str) -> bool:
+  """Check ``value`` against the ``EmailStr`` pattern without msgspec."""
+  return _EMAIL_RE.fullmatch(value) is not None
+
+
+def validate_hex(value: str) -> bool:
+  """Check ``value`` against the ``HexStr`` pattern without msgspec."""
+  return _HEX_RE.fullmatch(value) is not None
@@ -28,4 +28,11 @@ RightOpenUnitInterval: TypeAlias = Annotated[float, "ge=0,lt=1"]  # [0,1)
 
 NonEmptyStr: TypeAlias = Annotated[str, "pattern=r'^.*[^ ].*$'"]
 EmailStr: TypeAlias = Annotated[str, "pattern=r'^[^@ ]+@[^@ ]+\\.[^@ ]+$'"]
-HexStr: TypeAlias = Annotated[str, "pattern=r'^[0-9A-Fa-f]+$'"]
\ No newline at end of file
+HexStr: TypeAlias = Annotated[str, "pattern=r'^[0-9A-Fa-f]+$'"]
+
+# -----------------------------------------------------------------------------
+# Validation helpers
+
+def validate_nonempty(value: str) -> bool: ...
+def validate_email(value: str) -> bool: ...
+def validate_hex(value: str) -> bool: ...
\ No newline at end of file
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from abc import ABC
-from abc import abstractmethod
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, ClassVar, Final, Generic, TypeVar
 
 
 __all__ = (
@@ -15,17 +13,64 @@ __all__ = (
 SecretT = TypeVar("SecretT", bound=str | bytes)
 """Type that represents a secret value of type ``str`` or ``bytes``."""
 
+_OBSCURED_STR: Final = "******"
+_OBSCURED_BYTES: Final = b"******"
+_OBSCURED_BYTES_STR: Final = str(_OBSCURED_BYTES)  # "b'******'", kept for compatibility
 
-class SecretValue(ABC, Generic[SecretT]):
+if TYPE_CHECKING:
+  # parameterization exists for type checkers only: at runtime the MRO stays
+  # flat, avoiding Generic's __class_getitem__/alias allocations on import
+  class _SecretBase(Generic[SecretT]):
+    ...
+else:
+
+  class _SecretBase:
+    __slots__ = ()
+
+
+class SecretValue(_SecretBase):
   """Represents a secret value that can be of type `str` or `bytes`."""
 
+  # a single slot instead of a per-instance __dict__: these objects hold one
+  # attribute and get created for every secret parsed out of a config
+  __slots__ = ("_secret_value",)
+
+  _OBSCURED: ClassVar[str | bytes]
+  """The constant hidden representation - set once per subclass."""
+
+  _REPR: ClassVar[str | None] = None
+  """The constant repr string, folded once per subclass (``None`` = dynamic)."""
+
+  def __init_subclass__(cls, **kwargs) -> None:
+    super().__init_subclass__(**kwargs)
+    # enforce the must-override contract here instead of via ABCMeta, which
+    # would slow every isinstance check with its cache/registry lookup
+    if cls.get_obscured is SecretValue.get_obscured:
+      raise TypeError(f"{cls.__name__} must override get_obscured")
+    # the class name and obscured value never change, so the whole repr
+    # string can be folded to a constant at class-definition time - but only
+    # when _OBSCURED still matches get_obscured; a subclass overriding
+    # get_obscured without its own constant keeps the dynamic path
+    overrides = "get_obscured" in cls.__dict__ and "_OBSCURED" not in cls.__dict__
+    if hasattr(cls, "_OBSCURED") and not overrides:
+      cls._REPR = f"{cls.__name__}({cls._OBSCURED!r})"
+    else:
+      cls._REPR = None
+
   def __init__(self, secret_value: SecretT) -> None:
     """Initializes a :class:`SecretValue` object with a secret value of type ``str`` or ``bytes``.
 
     Args:
         secret_value (str | bytes): The secret value to be encapsulated.
+
+    Raises:
+        TypeError: If instantiated directly instead of via a subclass.
     """
 
+    # __init_subclass__ enforces the contract for subclasses; this keeps the
+    # base class itself abstract now that ABCMeta is gone
+    if type(self) is SecretValue:
+      raise TypeError("SecretValue cannot be instantiated directly; use SecretStr or SecretBytes")
     self._secret_value = secret_value
 
   def get_secret(self) -> SecretT:
@@ -37,7 +82,6 @@ class SecretValue(ABC, Generic[SecretT]):
 
     return self._secret_value
 
-  @abstractmethod
   def get_obscured(self) -> SecretT:
     """Return the hidden representation of the secret value.
 
@@ -54,6 +98,8 @@ class SecretValue(ABC, Generic[SecretT]):
         str: String representation of the hidden secret value.
     """
 
+    if self._REPR is not None:  # _OBSCURED is paired with the stock get_obscured
+      return str(self._OBSCURED)
     return str(self.get_obscured())
 
   def __repr__(self) -> str:
@@ -63,12 +109,17 @@ class SecretValue(ABC, Generic[SecretT]):
         str: String representation of the object.
     """
 
-    class_name = self.__class__.__name__
-    return f"{class_name}({self.get_obscured()!r})"
+    if self._REPR is not None:
+      return self._REPR
+    return f"{self.__class__.__name__}({self.get_obscured()!r})"
+
+
+class SecretStr(SecretValue):
+  """Represents a secret string value (``SecretValue[str]``)."""
 
+  __slots__ = ()
 
-class SecretStr(SecretValue[str]):
-  """Represents a secret string value."""
+  _OBSCURED = _OBSCURED_STR
 
   def get_obscured(self) -> str:
     """Overrides the base class method to return the hidden string value.
@@ -77,11 +128,22 @@ class SecretStr(SecretValue[str]):
         str: The hidden string representation of the secret value.
     """
 
-    return "******"
+    return _OBSCURED_STR
 
+  def __str__(self) -> str:
+    """Returns the hidden string value directly - it is already a ``str``."""
+
+    if type(self) is SecretStr:
+      return _OBSCURED_STR
+    return super().__str__()  # subclasses may override get_obscured
+
+
+class SecretBytes(SecretValue):
+  """Represents a secret bytes value (``SecretValue[bytes]``)."""
 
-class SecretBytes(SecretValue[bytes]):
-  """Represents a secret bytes value."""
+  __slots__ = ()
+
+  _OBSCURED = _OBSCURED_BYTES
 
   def get_obscured(self) -> bytes:
     """Overrides the base class method to return the hidden bytes value.
@@ -90,4 +152,11 @@ class SecretBytes(SecretValue[bytes]):
         bytes: The hidden bytes representation of the secret value.
     """
 
-    return b"******"
+    return _OBSCURED_BYTES
+
+  def __str__(self) -> str:
+    """Returns the precomputed string form of the hidden bytes value."""
+
+    if type(self) is SecretBytes:
+      return _OBSCURED_BYTES_STR
+    return super().__str__()  # subclasses may override get_obscured
@@ -5,6 +5,7 @@ import re
 from collections import abc
 from collections import defaultdict
 from collections import deque
+from functools import lru_cache
 from typing import (
   TYPE_CHECKING,
   AbstractSet,
@@ -206,6 +207,10 @@ def unwrap_annotation(annotation: Any) -> tuple[Any, tuple[Any, ...], set[Any]]:
   return annotation, tuple(metadata), wrappers
 
 
+# annotations are static, so repeated unwraps of the same one can be memoized
+_unwrap_annotation = lru_cache(maxsize=None)(unwrap_annotation)
+
+
 def unwrap_new_type(new_type: Any) -> Any:
   """Unwrap a (nested) ``typing.NewType``"""
 
@@ -227,7 +232,10 @@ def get_origin_or_inner_type(annotation: Any) -> Any:
 
   origin = get_origin(annotation)
   if origin in wrapper_type_set:
-    inner, _, _ = unwrap_annotation(annotation)
+    try:
+      inner, _, _ = _unwrap_annotation(annotation)
+    except TypeError:  # unhashable annotation - unwrap without the cache
+      inner, _, _ = unwrap_annotation(annotation)
     # we need to recursively call here 'get_origin_or_inner_type' because we might be dealing
     # with a generic type alias e.g. Annotated[dict[str, list[int]]
     origin = get_origin_or_inner_type(inner)
@@ -10,17 +10,24 @@ except ImportError:
 from spectic import Rule
 from spectic import asdict
 from spectic import asjson
+from spectic import asjson_many
+from spectic import asmsgpack
 from spectic import asyaml
 from spectic import check
 from spectic import field
 from spectic import fromdict
 from spectic import fromjson
+from spectic import fromjson_many
+from spectic import frommsgpack
 from spectic import fromyaml
 from spectic import rule
 from spectic import spec
 from spectic.types import ClosedUnitInterval
 from spectic.types import NonEmptyStr
 from spectic.types import PositiveInt
+from spectic.types.derived import validate_email
+from spectic.types.derived import validate_hex
+from spectic.types.derived import validate_nonempty
 
 
 @spec
@@ -242,6 +249,68 @@ def test_fromjson():
   assert user.age == 35
 
 
+def test_validate_helpers():
+  assert validate_nonempty("hello")
+  assert not validate_nonempty("")
+  assert not validate_nonempty("   ")
+
+  assert validate_email("alice@example.com")
+  assert not validate_email("not-an-email")
+
+  assert validate_hex("DEADbeef01")
+  assert not validate_hex("0xzz")
+
+
+def test_from_list():
+  users = User.from_list([{"name": "Ann", "age": 30}, {"name": "Ben", "age": 40}])
+  assert users == [User(name="Ann", age=30), User(name="Ben", age=40)]
+
+  # a bad element is reported with its index in the error location
+  with pytest.raises(msgspec.ValidationError, match=r"\$\[1\]"):
+    User.from_list([{"name": "Ann", "age": 30}, {"name": "Ben", "age": -1}])
+
+
+def test_spec_ide_hints_flag():
+  @spec(ide_hints=False)
+  class Lean:
+    value: int = field(ge=0)
+
+  # shims are skipped, validation still runs
+  assert "__pydantic_model__" not in Lean.__dict__
+  assert "__attrs_attrs__" not in Lean.__dict__
+  assert Lean(value=3).value == 3
+  with pytest.raises(msgspec.ValidationError):
+    Lean(value="not_a_number")
+
+  # shims are attached by default
+  assert "__pydantic_model__" in User.__dict__
+
+
+def test_json_many_roundtrip():
+  users = [User(name="Ann", age=30), User(name="Ben", age=40)]
+  json_bytes = asjson_many(users)
+  assert isinstance(json_bytes, bytes)
+  users2 = fromjson_many(json_bytes, User)
+  assert users2 == users
+
+  # a bad element is reported with its index in the error location
+  with pytest.raises(msgspec.ValidationError, match=r"\$\[1\]"):
+    fromjson_many(b'[{"name": "Ann", "age": 30}, {"name": "Ben", "age": -1}]', User)
+
+
+def test_msgpack_roundtrip():
+  user = User(name="Carol", age=28)
+  packed = asmsgpack(user)
+  assert isinstance(packed, bytes)
+  user2 = frommsgpack(packed, User)
+  assert isinstance(user2, User)
+  assert user2 == user
+
+  # constraints still apply on decode
+  with pytest.raises(msgspec.ValidationError):
+    frommsgpack(asmsgpack({"name": "Carol", "age": -1}), User)
+
+
 @pytest.mark.skipif(yaml is None, reason="pyyaml not installed")
 def test_asyaml():
   user = User(name="Dave", age=40)